@@ -35,10 +35,18 @@ import logging
 import os.path
 import string
 import time
+from functools import lru_cache
 
 import numpy as np
 import yaml
 
+try:
+    # Use the libyaml bindings if they are available, since parsing is
+    # considerably faster than with the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 import rmgpy.constants as constants
 from rmgpy import __version__
 from rmgpy.exceptions import InputError
@@ -73,6 +81,28 @@ def str_repr(dumper, data):
 
 yaml.add_representer(str, str_repr)
 
+# Map class names stored in .yml files to the classes themselves, built once
+# rather than on every load_yaml() call
+ARKANE_CLASS_DICT = {'ScalarQuantity': ScalarQuantity,
+                     'ArrayQuantity': ArrayQuantity,
+                     'Conformer': Conformer,
+                     'LinearRotor': LinearRotor,
+                     'NonlinearRotor': NonlinearRotor,
+                     'KRotor': KRotor,
+                     'SphericalTopRotor': SphericalTopRotor,
+                     'HinderedRotor': HinderedRotor,
+                     'FreeRotor': FreeRotor,
+                     'IdealGasTranslation': IdealGasTranslation,
+                     'HarmonicOscillator': HarmonicOscillator,
+                     'TransportData': TransportData,
+                     'SingleExponentialDown': SingleExponentialDown,
+                     'Wilhoit': Wilhoit,
+                     'NASA': NASA,
+                     'NASAPolynomial': NASAPolynomial,
+                     'ThermoData': ThermoData,
+                     'np_array': np.array,
+                     }
+
 
 class ArkaneSpecies(RMGObject):
     """
@@ -205,10 +235,11 @@ class ArkaneSpecies(RMGObject):
             # generate the xyz-format string from self.conformer.coordinates and self.conformer.number
             xyz_list.append(str(len(self.conformer.number.value_si)))
             xyz_list.append(self.label)
-            for number, coordinate in zip(self.conformer.number.value_si, self.conformer.coordinates.value_si):
+            coordinates = self.conformer.coordinates.value_si * 1e10  # convert m to Angstrom in one array operation
+            for number, coordinate in zip(self.conformer.number.value_si, coordinates):
                 element_symbol = get_element(int(number)).symbol
                 row = '{0:4}'.format(element_symbol)
-                row += '{0:14.8f}{1:14.8f}{2:14.8f}'.format(*(coordinate * 1e10).tolist())  # convert m to Angstrom
+                row += '{0:14.8f}{1:14.8f}{2:14.8f}'.format(*coordinate.tolist())
                 xyz_list.append(row)
         return '\n'.join(xyz_list)
 
@@ -239,7 +270,7 @@ class ArkaneSpecies(RMGObject):
         with open(path, 'r') as f:
             content = f.read()
         content = replace_yaml_syntax(content, label)
-        data = yaml.safe_load(stream=content)
+        data = yaml.load(stream=content, Loader=SafeLoader)
         if label:
             # First, warn the user if the label doesn't match
             try:
@@ -259,34 +290,18 @@ class ArkaneSpecies(RMGObject):
         if class_name != 'ArkaneSpecies':
             raise KeyError("Expected a ArkaneSpecies object, but got {0}".format(class_name))
         del data['class']
-        class_dict = {'ScalarQuantity': ScalarQuantity,
-                      'ArrayQuantity': ArrayQuantity,
-                      'Conformer': Conformer,
-                      'LinearRotor': LinearRotor,
-                      'NonlinearRotor': NonlinearRotor,
-                      'KRotor': KRotor,
-                      'SphericalTopRotor': SphericalTopRotor,
-                      'HinderedRotor': HinderedRotor,
-                      'FreeRotor': FreeRotor,
-                      'IdealGasTranslation': IdealGasTranslation,
-                      'HarmonicOscillator': HarmonicOscillator,
-                      'TransportData': TransportData,
-                      'SingleExponentialDown': SingleExponentialDown,
-                      'Wilhoit': Wilhoit,
-                      'NASA': NASA,
-                      'NASAPolynomial': NASAPolynomial,
-                      'ThermoData': ThermoData,
-                      'np_array': np.array,
-                      }
+        class_dict = ARKANE_CLASS_DICT
         freq_data = None
         if 'imaginary_frequency' in data:
             freq_data = data['imaginary_frequency']
             del data['imaginary_frequency']
         if not data['is_ts']:
-            if 'smiles' in data:
-                data['species'] = Species(smiles=data['smiles'])
-            elif 'adjacency_list' in data:
+            # Prefer the adjacency list, since it restores the stored graph directly
+            # without re-perceiving the structure from a SMILES or InChI string
+            if 'adjacency_list' in data:
                 data['species'] = Species().from_adjacency_list(data['adjacency_list'])
+            elif 'smiles' in data:
+                data['species'] = Species(smiles=data['smiles'])
             elif 'inchi' in data:
                 data['species'] = Species(inchi=data['inchi'])
             else:
@@ -317,7 +332,7 @@ def replace_yaml_syntax(content, label=None):
         content (str): The content of an Arkane YAML file.
 
     Returns:
-        str: The modified content to be processed via yaml.safe_load().
+        str: The modified content to be processed via yaml.load().
     """
     syntax_correction_dict = {'spinMultiplicity': 'spin_multiplicity',
                               'opticalIsomers': 'optical_isomers',
@@ -361,12 +376,15 @@ def check_conformer_energy(energies, path):
                         f'your computed thermodynamic properties and rate coefficients.')
 
 
+@lru_cache(maxsize=None)
 def get_element_mass(input_element, isotope=None):
     """
     Returns the mass and z number of the requested isotope for a given element.
     'input_element' can be wither the atomic number (integer) or an element symbol.
     'isotope' is an integer of the atomic z number. If 'isotope' is None, returns the most common isotope.
     Data taken from NIST, https://physics.nist.gov/cgi-bin/Compositions/stand_alone.pl (accessed October 2018)
+    The result is cached since the same few elements are requested over and over
+    when assembling conformers atom by atom.
     """
     symbol = None
     number = None
@@ -376,7 +394,7 @@ def get_element_mass(input_element, isotope=None):
         number = input_element
     elif isinstance(input_element, str):
         symbol = input_element
-        number = next(key for key, value in symbol_by_number.items() if value == input_element)
+        number = number_by_symbol.get(input_element)
 
     if symbol is None or number is None:
         raise ValueError('Could not identify element {0}'.format(input_element))
@@ -421,6 +439,9 @@ symbol_by_number = {1: 'H', 2: 'He', 3: 'Li', 4: 'Be', 5: 'B', 6: 'C', 7: 'N', 8
                     102: 'No', 103: 'Lr', 104: 'Rf', 105: 'Db', 106: 'Sg', 107: 'Bh', 108: 'Hs', 109: 'Mt', 110: 'Ds',
                     111: 'Rg', 112: 'Cn', 113: 'Nh', 114: 'Fl', 115: 'Mc', 116: 'Lv', 117: 'Ts', 118: 'Og'}
 
+# The reverse mapping, so symbols resolve to atomic numbers without scanning symbol_by_number
+number_by_symbol = {symbol: number for number, symbol in symbol_by_number.items()}
+
 # Structure of mass_by_symbol items: list(list(isotope1, mass1, weight1), list(isotope2, mass2, weight2), ...)
 mass_by_symbol = {
     'H': [[1, 1.00782503224, 0.999885], [2, 2.01410177812, 0.000115], [3, 3.0160492779, 0]],
@@ -41,7 +41,6 @@ from collections import OrderedDict
 
 from rmgpy.data.reference import Reference, Article, Book, Thesis
 from rmgpy.exceptions import DatabaseError, InvalidAdjacencyListError
-from rmgpy.kinetics.uncertainties import RateUncertainty
 from rmgpy.molecule import Molecule, Group
 
 
@@ -75,6 +74,12 @@ class Entry(object):
 
     """
 
+    # Large databases hold hundreds of thousands of entries, so store the
+    # attributes in slots rather than a per-instance __dict__. The `level`
+    # slot is assigned by Database._load_tree for entries in a tree.
+    __slots__ = ('index', 'label', 'item', 'parent', 'children', 'data', 'reference', 'reference_type',
+                 'short_desc', 'long_desc', 'rank', 'nodal_distance', 'level')
+
     def __init__(self,
                  index=-1,
                  label='',
@@ -203,6 +208,9 @@ class Database(object):
         local_context['solvent'] = self.solvent
         local_context['shortDesc'] = self.short_desc
         local_context['longDesc'] = self.long_desc
+        # Import here to avoid paying for the kinetics extension modules when
+        # this module is imported but no database file is ever loaded
+        from rmgpy.kinetics.uncertainties import RateUncertainty
         local_context['RateUncertainty'] = RateUncertainty
         # add in anything from the Class level dictionary.
         for key, value in Database.local_context.items():
@@ -211,7 +219,9 @@ class Database(object):
         # Process the file
         f = open(path, 'r')
         try:
-            exec(f.read(), global_context, local_context)
+            # Compiling with the real filename keeps tracebacks pointing at
+            # the database file instead of '<string>'
+            exec(compile(f.read(), path, 'exec'), global_context, local_context)
         except Exception:
             logging.error('Error while reading database {0!r}.'.format(path))
             raise
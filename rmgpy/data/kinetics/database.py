@@ -158,8 +158,8 @@ class KineticsDatabase(object):
         If all items begin with a `!` (e.g. ['!H_Abstraction']), then the
         selection will be inverted to families NOT in the list.
         """
-        dirs = os.listdir(path)
-        all_families = set([item for item in dirs if os.path.isdir(os.path.join(path, item))])  # Only keep folders
+        with os.scandir(path) as dirs:
+            all_families = set([item.name for item in dirs if item.is_dir()])  # Only keep folders
         all_families.discard('__pycache__')
 
         # Convert input to a list to simplify processing
@@ -34,6 +34,7 @@ This module contains functionality for working with kinetics libraries.
 import codecs
 import logging
 import os.path
+import pickle
 import re
 from collections import OrderedDict
 
@@ -48,6 +49,13 @@ from rmgpy.molecule import Molecule
 from rmgpy.reaction import Reaction
 from rmgpy.species import Species
 
+# Controls whether the free-text entry descriptions in kinetics libraries are
+# kept in memory when loading; set RMG_LOAD_COMMENTS=0 in the environment to
+# drop them and save the string allocations on runs that never render them.
+# Kinetics comments themselves are always kept, since auto-generated seed
+# libraries store the original family and template information there.
+RMG_LOAD_COMMENTS = os.environ.get('RMG_LOAD_COMMENTS', '1').lower() not in ('0', 'false', 'no')
+
 
 ################################################################################
 
@@ -209,6 +217,24 @@ class LibraryReaction(Reaction):
         return False
 
 
+################################################################################
+
+def _duplicate_reaction_key(reaction):
+    """
+    Return a hashable key grouping reactions that could possibly be duplicates.
+
+    Isomorphic reactions must have identical molecular formulas on each side
+    (in either direction), so grouping by this key lets duplicate searches
+    restrict the expensive isomorphism checks to reactions within the same
+    group instead of comparing every pair of entries.
+    """
+    def formulas(species_list):
+        return tuple(sorted(spc.molecule[0].get_formula() if isinstance(spc, Species) else spc.get_formula()
+                            for spc in species_list))
+
+    return frozenset([formulas(reaction.reactants), formulas(reaction.products)])
+
+
 ################################################################################
 
 class KineticsLibrary(Database):
@@ -293,12 +319,17 @@ class KineticsLibrary(Database):
         If ``mark_duplicates`` is set to ``True``, then ignore and
         mark all duplicate reactions as duplicate.
         """
+        # Group the entries by the molecular formulas on either side of the
+        # reaction; only reactions in the same group can be isomorphic
+        groups = {}
+        for entry in self.entries.values():
+            groups.setdefault(_duplicate_reaction_key(entry.item), []).append(entry)
         for entry0 in self.entries.values():
             reaction0 = entry0.item
             if not reaction0.duplicate:
                 # This reaction is not marked as a duplicate reaction
                 # This means that if we find any duplicate reactions, it is an error
-                for entry in self.entries.values():
+                for entry in groups[_duplicate_reaction_key(reaction0)]:
                     reaction = entry.item
                     if reaction0 is not reaction and reaction0.is_isomorphic(reaction):
                         # We found a duplicate reaction that wasn't marked!
@@ -379,6 +410,11 @@ class KineticsLibrary(Database):
         logging.debug("NB. the entries have not been renumbered, so these indices are missing.")
 
     def load(self, path, local_context=None, global_context=None):
+        # Prefer a pre-parsed pickled copy of the library, if a fresh one
+        # exists, over exec'ing the Python source
+        if self.load_pickle(path):
+            return
+
         # Clear any previously-loaded data
         self.entries = OrderedDict()
         self.top = []
@@ -405,7 +441,7 @@ class KineticsLibrary(Database):
         # Process the file
         f = open(path, 'r')
         try:
-            exec(f.read(), global_context, local_context)
+            exec(compile(f.read(), path, 'exec'), global_context, local_context)
         except Exception:
             logging.error('Error while reading database {0!r}.'.format(path))
             raise
@@ -496,6 +532,61 @@ class KineticsLibrary(Database):
             self.check_for_duplicates()
             self.convert_duplicates_to_multi()
 
+    def load_pickle(self, path):
+        """
+        Try to load this library from a pickled copy saved next to the Python
+        source file at `path` by :meth:`save_pickle`. The pickle is only used
+        if it is at least as recent as both the source file and its species
+        dictionary. Returns ``True`` if the library was loaded and ``False``
+        if no usable pickle was found, in which case the caller should parse
+        the Python source as usual.
+        """
+        pickle_path = os.path.splitext(path)[0] + '.pkl'
+        dictionary_path = os.path.join(os.path.dirname(path), 'dictionary.txt')
+        try:
+            pickle_mtime = os.path.getmtime(pickle_path)
+            if pickle_mtime < os.path.getmtime(path):
+                return False
+            if os.path.exists(dictionary_path) and pickle_mtime < os.path.getmtime(dictionary_path):
+                return False
+            with open(pickle_path, 'rb') as f:
+                data = pickle.load(f)
+        except OSError:
+            return False
+        except Exception:
+            # An unreadable pickle (e.g. written by a different RMG version)
+            # should not prevent loading the library from source
+            logging.warning('Could not read pickled kinetics library {0!r}; '
+                            'loading {1!r} instead.'.format(pickle_path, path))
+            return False
+        self.name = data['name']
+        self.solvent = data['solvent']
+        self.short_desc = data['shortDesc']
+        self.long_desc = data['longDesc']
+        self.auto_generated = data['autoGenerated']
+        self.entries = data['entries']
+        self.top = []
+        logging.debug('Loaded kinetics library from pickle at {0!r}'.format(pickle_path))
+        return True
+
+    def save_pickle(self, path):
+        """
+        Save a pre-parsed binary copy of the already-loaded library to `path`
+        (conventionally ``reactions.pkl`` alongside ``reactions.py``), so that
+        subsequent calls to :meth:`load` can read the entries in a single
+        ``pickle.load`` instead of exec'ing the Python source.
+        """
+        data = {
+            'name': self.name,
+            'solvent': self.solvent,
+            'shortDesc': self.short_desc,
+            'longDesc': self.long_desc,
+            'autoGenerated': self.auto_generated,
+            'entries': self.entries,
+        }
+        with open(path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
     def load_entry(self,
                    index,
                    label,
@@ -532,6 +623,14 @@ class KineticsLibrary(Database):
         #    raise DatabaseError('Reaction {0} in kinetics library {1} was not balanced! Please reformulate.'.format(rxn, self.label))
         # label = str(rxn)
         assert index not in self.entries, "Index of reaction {0} is not unique!".format(label)
+        if not RMG_LOAD_COMMENTS:
+            shortDesc = ''
+            longDesc = ''
+        longDesc = longDesc.strip()
+        if kinetics is not None and getattr(kinetics, 'comment', None) == longDesc:
+            # The kinetics comment usually repeats the entry description;
+            # share a single str object instead of keeping two copies
+            longDesc = kinetics.comment
         self.entries[index] = Entry(
             index=index,
             label=label,
@@ -540,7 +639,7 @@ class KineticsLibrary(Database):
             reference=reference,
             reference_type=referenceType,
             short_desc=shortDesc,
-            long_desc=longDesc.strip(),
+            long_desc=longDesc,
         )
 
     def save(self, path):
@@ -664,12 +763,9 @@ class KineticsLibrary(Database):
                     if formula in ['He', 'Ar', 'N2', 'Ne']:
                         pass
                     else:
-                        found = False
-                        for species in species_dict.values():
-                            for mol in species.molecule:
-                                if mol.is_isomorphic(molecule):
-                                    found = True
-                                    break
+                        found = any(mol.is_isomorphic(molecule)
+                                    for species in species_dict.values()
+                                    for mol in species.molecule)
                         if not found:
                             species_dict[formula] = Species(label=formula, molecule=[molecule])
 
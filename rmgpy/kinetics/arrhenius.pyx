@@ -70,14 +70,17 @@ cdef class Arrhenius(KineticsModel):
         self.A = A
         self.n = n
         self.Ea = Ea
-        self.T0 = T0
+        self.T0 = T0 if T0 is not None else (1.0, "K")
 
     def __repr__(self):
         """
         Return a string representation that can be used to reconstruct the
-        Arrhenius object.
+        Arrhenius object. The reference temperature is omitted when it has
+        the default value of 1 K.
         """
-        string = 'Arrhenius(A={0!r}, n={1!r}, Ea={2!r}, T0={3!r}'.format(self.A, self.n, self.Ea, self.T0)
+        string = 'Arrhenius(A={0!r}, n={1!r}, Ea={2!r}'.format(self.A, self.n, self.Ea)
+        if self._T0.value_si != 1.0 or self._T0.units != 'K':
+            string += ', T0={0!r}'.format(self.T0)
         if self.Tmin is not None: string += ', Tmin={0!r}'.format(self.Tmin)
         if self.Tmax is not None: string += ', Tmax={0!r}'.format(self.Tmax)
         if self.Pmin is not None: string += ', Pmin={0!r}'.format(self.Pmin)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This module contains the :class:`BatchArrhenius` class, a struct-of-arrays
+representation of a collection of modified Arrhenius expressions that allows
+rate coefficients for all of them to be evaluated with a single vectorized
+NumPy call instead of a Python-level loop over :class:`Arrhenius` objects.
+"""
+
+import math
+
+import numpy as np
+
+import rmgpy.constants as constants
+
+
+def _k_batch_numpy(A, n, Ea, T0, T):
+    """
+    Evaluate ``k = A * (T/T0)**n * exp(-Ea / (R*T))`` for arrays of Arrhenius
+    parameters in SI units at temperature `T` in K.
+    """
+    return A * (T / T0) ** n * np.exp(-Ea / (constants.R * T))
+
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is an optional dependency; the NumPy expression above is the
+    # fallback evaluator
+    _k_batch = _k_batch_numpy
+else:
+    _R = constants.R
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _k_batch(A, n, Ea, T0, T):
+        """
+        Numba kernel equivalent to :func:`_k_batch_numpy`, fusing the
+        temporaries of the NumPy expression into a single parallel pass.
+        """
+        k = np.empty(A.size)
+        for i in prange(A.size):
+            k[i] = A[i] * (T / T0[i]) ** n[i] * math.exp(-Ea[i] / (_R * T))
+        return k
+
+    # Trigger compilation at import time (cached on disk via cache=True) so
+    # the first real evaluation does not pay the JIT cost
+    _k_batch(np.ones(1), np.zeros(1), np.zeros(1), np.ones(1), 1000.0)
+
+
+class BatchArrhenius(object):
+    """
+    A set of modified Arrhenius expressions stored as parallel ``float64``
+    arrays in SI units. The attributes are:
+
+    =============== =============================================================
+    Attribute       Description
+    =============== =============================================================
+    `A`             The preexponential factors in SI units
+    `n`             The temperature exponents
+    `Ea`            The activation energies in J/mol
+    `T0`            The reference temperatures in K
+    =============== =============================================================
+
+    Unlike the per-reaction :class:`Arrhenius` objects it is built from, a
+    :class:`BatchArrhenius` carries no units, labels, or comments; it exists
+    purely so that hot loops can compute rate coefficients for many reactions
+    at once.
+    """
+
+    def __init__(self, A, n, Ea, T0):
+        self.A = np.asarray(A, dtype=np.float64)
+        self.n = np.asarray(n, dtype=np.float64)
+        self.Ea = np.asarray(Ea, dtype=np.float64)
+        self.T0 = np.asarray(T0, dtype=np.float64)
+
+    def __len__(self):
+        return self.A.size
+
+    @classmethod
+    def from_arrhenius_list(cls, kinetics_list):
+        """
+        Build a :class:`BatchArrhenius` from an iterable of :class:`Arrhenius`
+        objects, converting each boxed quantity to SI units once up front.
+        """
+        kinetics_list = list(kinetics_list)
+        return cls(
+            A=[kinetics.A.value_si for kinetics in kinetics_list],
+            n=[kinetics.n.value_si for kinetics in kinetics_list],
+            Ea=[kinetics.Ea.value_si for kinetics in kinetics_list],
+            T0=[kinetics.T0.value_si for kinetics in kinetics_list],
+        )
+
+    def get_rate_coefficients(self, T):
+        """
+        Return the rate coefficients in SI units for all expressions at
+        temperature `T` in K, as a ``float64`` array with one element per
+        expression.
+        """
+        return _k_batch(self.A, self.n, self.Ea, self.T0, float(T))
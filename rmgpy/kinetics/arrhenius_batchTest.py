@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+###############################################################################
+#                                                                             #
+# RMG - Reaction Mechanism Generator                                          #
+#                                                                             #
+# Copyright (c) 2002-2019 Prof. William H. Green (whgreen@mit.edu),           #
+# Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)   #
+#                                                                             #
+# Permission is hereby granted, free of charge, to any person obtaining a     #
+# copy of this software and associated documentation files (the 'Software'),  #
+# to deal in the Software without restriction, including without limitation   #
+# the rights to use, copy, modify, merge, publish, distribute, sublicense,    #
+# and/or sell copies of the Software, and to permit persons to whom the       #
+# Software is furnished to do so, subject to the following conditions:        #
+#                                                                             #
+# The above copyright notice and this permission notice shall be included in  #
+# all copies or substantial portions of the Software.                         #
+#                                                                             #
+# THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR  #
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,    #
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE #
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER      #
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING     #
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER         #
+# DEALINGS IN THE SOFTWARE.                                                   #
+#                                                                             #
+###############################################################################
+
+"""
+This script contains unit tests of the :mod:`rmgpy.kinetics.arrhenius_batch` module.
+"""
+
+import unittest
+
+from rmgpy.kinetics.arrhenius import Arrhenius
+from rmgpy.kinetics.arrhenius_batch import BatchArrhenius
+
+
+################################################################################
+
+class TestBatchArrhenius(unittest.TestCase):
+    """
+    Contains unit tests of the BatchArrhenius class.
+    """
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        self.kinetics_list = [
+            Arrhenius(A=(1.0e12, 'cm^3/(mol*s)'), n=0.5, Ea=(41.84, 'kJ/mol'), T0=(1, 'K')),
+            Arrhenius(A=(2.5e8, 's^-1'), n=1.2, Ea=(10.0, 'kcal/mol'), T0=(300, 'K')),
+            Arrhenius(A=(7.3e10, 'cm^3/(mol*s)'), n=0.0, Ea=(0.0, 'kJ/mol'), T0=(1, 'K')),
+        ]
+        self.batch = BatchArrhenius.from_arrhenius_list(self.kinetics_list)
+
+    def test_length(self):
+        """
+        Test that the batch contains one entry per Arrhenius expression.
+        """
+        self.assertEqual(len(self.batch), len(self.kinetics_list))
+
+    def test_si_parameters(self):
+        """
+        Test that the parameters are stored in SI units.
+        """
+        for i, kinetics in enumerate(self.kinetics_list):
+            self.assertAlmostEqual(self.batch.A[i], kinetics.A.value_si, delta=1e-6 * kinetics.A.value_si)
+            self.assertAlmostEqual(self.batch.n[i], kinetics.n.value_si, 6)
+            self.assertAlmostEqual(self.batch.Ea[i], kinetics.Ea.value_si, delta=1e-6 * abs(kinetics.Ea.value_si) + 1e-6)
+            self.assertAlmostEqual(self.batch.T0[i], kinetics.T0.value_si, 6)
+
+    def test_rate_coefficients_match_arrhenius(self):
+        """
+        Test that the vectorized evaluation agrees with Arrhenius.get_rate_coefficient().
+        """
+        for T in [300, 500, 1000, 1500, 2000]:
+            k_batch = self.batch.get_rate_coefficients(T)
+            for i, kinetics in enumerate(self.kinetics_list):
+                k_expected = kinetics.get_rate_coefficient(T)
+                self.assertAlmostEqual(k_batch[i], k_expected, delta=1e-6 * k_expected)
+
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
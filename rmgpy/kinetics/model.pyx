@@ -296,7 +296,7 @@ cdef class PDepKineticsModel(KineticsModel):
                                comment=comment)
         self.efficiencies = {}
         if efficiencies:
-            for mol, eff in efficiencies.iteritems():
+            for mol, eff in efficiencies.items():
                 if isinstance(mol, str):
                     # Assume it is a SMILES string
                     self.efficiencies[Molecule().from_smiles(mol)] = eff
@@ -357,7 +357,7 @@ cdef class PDepKineticsModel(KineticsModel):
         # iterating over the species with efficiencies is faster
         Peff = 0.0
         eff_frac = 0.0
-        for mol, eff in self.efficiencies.iteritems():
+        for mol, eff in self.efficiencies.items():
             for spec in species:
                 if spec.is_isomorphic(mol):
                     i = species.index(spec)
@@ -390,7 +390,7 @@ cdef class PDepKineticsModel(KineticsModel):
         cdef int i
 
         all_efficiencies = np.ones(len(species), np.float64)
-        for mol, eff in self.efficiencies.iteritems():
+        for mol, eff in self.efficiencies.items():
             for spec in species:
                 if spec.is_isomorphic(mol):
                     i = species.index(spec)
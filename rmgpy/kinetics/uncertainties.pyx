@@ -29,6 +29,8 @@
 This module contains information related to kinetic uncertainties
 """
 
+import sys
+
 import numpy as np
 cimport numpy as np
 
@@ -47,6 +49,10 @@ cdef class RateUncertainty(object):
 
     def __init__(self, mu, var, Tref, N=None, correlation=None):
         self.Tref = Tref
+        if isinstance(correlation, str):
+            # The same rate-rule node path appears in many entries; intern it
+            # so they all share a single string object
+            correlation = sys.intern(correlation)
         self.correlation = correlation
         self.mu = mu
         self.var = var
@@ -142,25 +142,18 @@ def get_element(value, isotope=-1):
     number. If a string is provided, the value is treated as the symbol. An
     :class:`ElementError` is raised if no matching element is found.
     """
-    cython.declare(element=Element, number=cython.int, symbol=str)
     if isinstance(value, int):
         # The parameter is an integer; assume this is the atomic number
-        number = value
-        for element in element_list:
-            if element.number == number and element.isotope == isotope:
-                return element
-        # If we reach this point that means we did not find an appropriate element,
-        # so we raise an exception
-        raise ElementError("No element found with atomic number %i, and isotope %i" % (number, isotope))
+        try:
+            return element_index[(value, isotope)]
+        except KeyError:
+            raise ElementError("No element found with atomic number %i, and isotope %i" % (value, isotope))
     elif isinstance(value, str):
         # The parameter is a string; assume this is the element symbol
-        symbol = value
-        for element in element_list:
-            if element.symbol == symbol and element.isotope == isotope:
-                return element
-        # If we reach this point that means we did not find an appropriate element,
-        # so we raise an exception
-        raise ElementError("No element found with symbol %s, and isotope %i." % (symbol, isotope))
+        try:
+            return element_index[(value, isotope)]
+        except KeyError:
+            raise ElementError("No element found with symbol %s, and isotope %i." % (value, isotope))
     else:
         raise ElementError('No element found based on parameter %s "%r", isotope: %i.' % (type(value), value, isotope))
 
@@ -321,6 +314,13 @@ element_list = [
     Fr, Ra, Ac, Th, Pa, U, Np, Pu, Am, Cm, Bk, Cf, Es, Fm, Md, No, Lr, Rf, Db, Sg, Bh, Hs, Mt, Ds, Rg, Cn
 ]
 
+# An index of the elements by (atomic number, isotope) and (symbol, isotope),
+# so that get_element() is a dictionary lookup rather than a scan of element_list
+element_index = {}
+for element in element_list:
+    element_index[(element.number, element.isotope)] = element
+    element_index[(element.symbol, element.isotope)] = element
+
 # Bond Dissociation Energies
 # References:
 # Huheey, pps. A-21 to A-34; T.L. Cottrell, "The Strengths of Chemical Bonds," 2nd ed., Butterworths, London, 1958
@@ -88,7 +88,33 @@ class Units(RMGObject):
 
     # A dict of conversion factors (to SI) for each of the frequent units
     # Here we also define that cm^-1 is not to be converted to m^-1 (or Hz, J, K, etc.)
-    conversionFactors = {'cm^-1': 1.0}
+    # The factors below are exact by definition and are pre-seeded so that
+    # loading databases does not hit the (slow!) quantities fallback for the
+    # unit spellings that appear in nearly every entry
+    conversionFactors = {
+        'cm^-1': 1.0,
+        '': 1.0,
+        'K': 1.0,
+        's': 1.0,
+        's^-1': 1.0,
+        'Pa': 1.0,
+        'bar': 1.0e5,
+        'atm': 101325.0,
+        'J/mol': 1.0,
+        'kJ/mol': 1.0e3,
+        'cal/mol': 4.184,
+        'kcal/mol': 4184.0,
+        'J/(mol*K)': 1.0,
+        'kJ/(mol*K)': 1.0e3,
+        'cal/(mol*K)': 4.184,
+        'kcal/(mol*K)': 4184.0,
+        'g/mol': 1.0e-3,
+        'kg/mol': 1.0,
+        'm^3/(mol*s)': 1.0,
+        'm^6/(mol^2*s)': 1.0,
+        'cm^3/(mol*s)': 1.0e-6,
+        'cm^6/(mol^2*s)': 1.0e-12,
+    }
 
     def __init__(self, units=''):
         if units in NOT_IMPLEMENTED_UNITS:
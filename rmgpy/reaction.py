@@ -874,24 +874,25 @@ class Reaction:
         elif isinstance(kf, ThirdBody):
             lowPkunits = get_rate_coefficient_units_from_reaction_order(len(self.products) + 1)
             krLow = self.reverse_arrhenius_rate(kf.arrheniusLow, lowPkunits)
-            parameters = kf.__reduce__()[1]  # use the pickle helper to get all the other things needed
-            kr = ThirdBody(krLow, *parameters[1:])
+            kr = ThirdBody(arrheniusLow=krLow, Tmin=kf.Tmin, Tmax=kf.Tmax, Pmin=kf.Pmin, Pmax=kf.Pmax,
+                           efficiencies=kf.efficiencies, comment=kf.comment)
             return kr
 
         elif isinstance(kf, Lindemann):
             krHigh = self.reverse_arrhenius_rate(kf.arrheniusHigh, kunits)
             lowPkunits = get_rate_coefficient_units_from_reaction_order(len(self.products) + 1)
             krLow = self.reverse_arrhenius_rate(kf.arrheniusLow, lowPkunits)
-            parameters = kf.__reduce__()[1]  # use the pickle helper to get all the other things needed
-            kr = Lindemann(krHigh, krLow, *parameters[2:])
+            kr = Lindemann(arrheniusHigh=krHigh, arrheniusLow=krLow, Tmin=kf.Tmin, Tmax=kf.Tmax,
+                           Pmin=kf.Pmin, Pmax=kf.Pmax, efficiencies=kf.efficiencies, comment=kf.comment)
             return kr
 
         elif isinstance(kf, Troe):
             krHigh = self.reverse_arrhenius_rate(kf.arrheniusHigh, kunits)
             lowPkunits = get_rate_coefficient_units_from_reaction_order(len(self.products) + 1)
             krLow = self.reverse_arrhenius_rate(kf.arrheniusLow, lowPkunits)
-            parameters = kf.__reduce__()[1]  # use the pickle helper to get all the other things needed
-            kr = Troe(krHigh, krLow, *parameters[2:])
+            kr = Troe(arrheniusHigh=krHigh, arrheniusLow=krLow, alpha=kf.alpha, T3=kf.T3, T1=kf.T1, T2=kf.T2,
+                      Tmin=kf.Tmin, Tmax=kf.Tmax, Pmin=kf.Pmin, Pmax=kf.Pmax, efficiencies=kf.efficiencies,
+                      comment=kf.comment)
             return kr
         else:
             raise ReactionError("Unexpected kinetics type {0}; "
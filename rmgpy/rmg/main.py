@@ -1380,10 +1380,15 @@ class RMG(util.Subject):
             kinetics_library.name = 'seed'
             kinetics_library.save(os.path.join(seed_dir, 'seed', 'reactions.py'))
             kinetics_library.save_dictionary(os.path.join(seed_dir, 'seed', 'dictionary.txt'))
+            # Also write a pre-parsed binary copy so restarting from this seed
+            # does not have to exec reactions.py again. The pickle is written
+            # last so that it is at least as recent as the source files.
+            kinetics_library.save_pickle(os.path.join(seed_dir, 'seed', 'reactions.pkl'))
 
             edge_kinetics_library.name = 'seed_edge'
             edge_kinetics_library.save(os.path.join(seed_dir, 'seed_edge', 'reactions.py'))
             edge_kinetics_library.save_dictionary(os.path.join(seed_dir, 'seed_edge', 'dictionary.txt'))
+            edge_kinetics_library.save_pickle(os.path.join(seed_dir, 'seed_edge', 'reactions.pkl'))
 
             # Save the filter tensors
             if not os.path.exists(filter_dir):